@@ -2,6 +2,8 @@ import logging
 import httpx
 import json
 import time
+from typing import Dict
+from urllib.parse import urlparse
 from tenacity import (retry, stop_after_attempt, wait_random_exponential, before_log,
                       retry_if_exception_type, after_log)
 
@@ -9,22 +11,112 @@ from tenacity import (retry, stop_after_attempt, wait_random_exponential, before
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class CircuitOpenError(Exception):
+    """Raised when a request is short-circuited because its host is failing."""
+
+class CircuitBreaker:
+    def __init__(self, host: str, failure_threshold: int = 5, probe_interval: float = 60.0) -> None:
+        """
+        Initialize a new CircuitBreaker object for the given host.
+
+        Args:
+            host (str): The host guarded by this breaker.
+            failure_threshold (int): Consecutive failures before the circuit opens.
+            probe_interval (float): Seconds to wait between probe requests while open.
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.failures = 0
+        self.opened_at = None
+        self.tripped = False
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request to the host may be sent. While the circuit is
+        open, a single probe request is let through every probe_interval seconds.
+
+        Returns:
+            bool: True if the request may be sent, False if it should be short-circuited.
+        """
+        if not self.is_open:
+            return True
+        if time.monotonic() - self.opened_at >= self.probe_interval:
+            # Restart the timer so only one probe goes out per interval
+            self.opened_at = time.monotonic()
+            self.logger.info(f"Sending probe request, Host: {self.host}")
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self.is_open:
+            self.logger.info(f"Circuit closed, Host: {self.host}")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.is_open or self.failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self) -> None:
+        if not self.is_open:
+            self.logger.warning(
+                f"Circuit opened after {self.failures} consecutive failures, Host: {self.host}")
+        self.opened_at = time.monotonic()
+        self.tripped = True
+
+def _retries_exhausted(retry_state) -> None:
+    """Open the circuit once a request has used up all of its retry attempts."""
+    api = retry_state.args[0]
+    endpoint = retry_state.args[1] if len(retry_state.args) > 1 else retry_state.kwargs['endpoint']
+    api._breaker(endpoint).trip()
+    raise CircuitOpenError(
+        f"Retries exhausted, Endpoint: {endpoint}") from retry_state.outcome.exception()
+
 class API:
     def __init__(self, base_url: str, rate_limit: float = 0.5) -> None:
         self.base_url = base_url
         self.session = httpx.Client()
         self.logger = logging.getLogger(self.__class__.__name__)
         self.rate_limit = rate_limit
+        self.breakers: Dict[str, CircuitBreaker] = {}
 
     def _wait(self):
         time.sleep(self.rate_limit)
 
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        host = urlparse(endpoint).netloc
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(host)
+        return self.breakers[host]
+
+    @property
+    def degraded(self) -> bool:
+        """
+        Whether any host of this API tripped its circuit breaker during the run,
+        meaning some requests were dropped and the collected results are incomplete.
+        """
+        return any(breaker.tripped for breaker in self.breakers.values())
+
+    def _failed(self, breaker: CircuitBreaker, endpoint: str, error: Exception) -> None:
+        breaker.record_failure()
+        if breaker.is_open:
+            # Stop retrying once the host is considered down
+            raise CircuitOpenError(f"Circuit open, Endpoint: {endpoint}") from error
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_random_exponential(multiplier=1, max=60, min=30),
         retry=retry_if_exception_type(
             (httpx.RequestError, httpx.HTTPStatusError, json.JSONDecodeError)),
-        after=after_log(logger, logging.WARNING)
+        after=after_log(logger, logging.WARNING),
+        retry_error_callback=_retries_exhausted
     )
     def get(self, endpoint: str, params: dict = None) -> dict:
         """
@@ -36,23 +128,43 @@ class API:
 
         Returns:
             dict: A dictionary representing the response JSON.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker for the endpoint's host is open.
         """
+        breaker = self._breaker(endpoint)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open, Endpoint: {endpoint}")
+
         try:
             response = self.session.get(endpoint, params=params, timeout=60.0)
             response.raise_for_status()
             self._wait()
-            return response.json()
-        except httpx.HTTPError as e:
-            if hasattr(e, 'response') and e.response.status_code == 403:
-                return e.response.json()
-            if e.response.status_code == 404:
-                return e.response.json()
-            else:
-                self.logger.error(f"Error: {e}, Endpoint: {endpoint}")
-                raise
+            response_json = response.json()
+            breaker.record_success()
+            return response_json
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (403, 404):
+                try:
+                    response_json = e.response.json()
+                except json.JSONDecodeError as err:
+                    self.logger.error(
+                        f"Error decoding response JSON: {err}, Endpoint: {endpoint}")
+                    self._failed(breaker, endpoint, err)
+                    raise
+                breaker.record_success()
+                return response_json
+            self.logger.error(f"Error: {e}, Endpoint: {endpoint}")
+            self._failed(breaker, endpoint, e)
+            raise
+        except httpx.RequestError as e:
+            self.logger.error(f"Error: {e}, Endpoint: {endpoint}")
+            self._failed(breaker, endpoint, e)
+            raise
         except json.JSONDecodeError as e:
             self.logger.error(
                 f"Error decoding response JSON: {e}, Endpoint: {endpoint}")
+            self._failed(breaker, endpoint, e)
             raise
         except Exception as e:
             # Ignore any error raised after all retry attempts
@@ -2,7 +2,7 @@ import json
 from typing import List
 import logging
 import os
-from config import API
+from config import API, CircuitOpenError
 from platforms.hackerone import HackerOneAPI
 from platforms.bugcrowd import BugcrowdAPI
 from platforms.intigriti import IntigritiAPI
@@ -28,9 +28,15 @@ class PublicPrograms:
         """
         Save the results in JSON format to the specified file.
 
+        Nothing is written if the API tripped its circuit breaker during the run,
+        so the last good data for the platform is kept.
+
         Args:
             file_path (str): The path to the file where the results will be saved.
         """
+        if self.api.degraded:
+            self.logger.warning(f"Platform unavailable, keeping previous {file_name}")
+            return
         if not os.path.exists(self.results_directory):
             os.makedirs(self.results_directory)
         with open(f"{self.results_directory}/{file_name}", 'w') as outfile:
@@ -55,7 +61,10 @@ class PublicPrograms:
 
         for scope in self.results:
             scope_handle = scope.get('attributes').get('handle')
-            response_json = self.api.program_info(scope_handle)
+            try:
+                response_json = self.api.program_info(scope_handle)
+            except CircuitOpenError:
+                continue
             
             if 'relationships' in response_json:
                 scope['relationships'] = response_json['relationships']
@@ -94,7 +103,10 @@ class PublicPrograms:
         local_results = []
         for scope in self.results:
             scope_handle = scope.get('briefUrl', '').strip("/")
-            response_json = self.api.program_info(scope_handle)
+            try:
+                response_json = self.api.program_info(scope_handle)
+            except CircuitOpenError:
+                continue
 
             if response_json and response_json.get('status') != 'deleted':
                 scope['target_groups'] = response_json.get('target_groups')
@@ -130,7 +142,10 @@ class PublicPrograms:
 
         for scope in self.results:
             scope_handle = scope.get('slug')
-            response_json = self.api.program_info(scope_handle)
+            try:
+                response_json = self.api.program_info(scope_handle)
+            except CircuitOpenError:
+                continue
 
             if 'scopes' in response_json:
                 scope['scopes'] = response_json['scopes']
@@ -171,7 +186,10 @@ class PublicPrograms:
         local_results = []
         for scope in self.results:
             scope_handle = scope.get('id')
-            response_json = self.api.program_info(scope_handle)
+            try:
+                response_json = self.api.program_info(scope_handle)
+            except CircuitOpenError:
+                continue
 
             if 'domains' in response_json:
                 scope['domains'] = response_json['domains']['content']
@@ -214,10 +232,17 @@ def main():
 
     # Gather program information from multiple platforms sequentially
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        executor.submit(public_programs_bugcrowd.get_bugcrowd_programs)
-        executor.submit(public_programs_hackerone.get_hackerone_programs)
-        executor.submit(public_programs_intigriti.get_intigriti_programs)
-        executor.submit(public_programs_yeswehack.get_yeswehack_programs)
+        futures = [
+            executor.submit(public_programs_bugcrowd.get_bugcrowd_programs),
+            executor.submit(public_programs_hackerone.get_hackerone_programs),
+            executor.submit(public_programs_intigriti.get_intigriti_programs),
+            executor.submit(public_programs_yeswehack.get_yeswehack_programs),
+        ]
+
+    # A failing platform must not hide the others, so only log its error
+    for future in futures:
+        if future.exception() is not None:
+            logging.error(f"Error crawling platform: {future.exception()}")
 
     logging.info("Programs crawled successfully.")
 
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httpx
+from tenacity import wait_none
+
+from config import API, CircuitOpenError
+from main import PublicPrograms
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.wait = API.get.retry.wait
+        API.get.retry.wait = wait_none()
+        self.clock = [1000.0]
+        patcher = mock.patch('config.time.monotonic', lambda: self.clock[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.status = 500
+        self.text = ''
+        self.calls = 0
+        self.api = API(base_url='https://c.com', rate_limit=0)
+        self.api.session = httpx.Client(transport=httpx.MockTransport(self.handler))
+
+    def tearDown(self) -> None:
+        API.get.retry.wait = self.wait
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        return httpx.Response(self.status, text=self.text)
+
+    def test_opens_after_threshold(self):
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        self.assertEqual(self.calls, 5)
+        self.assertTrue(self.api.breakers['c.com'].is_open)
+        self.assertTrue(self.api.degraded)
+
+    def test_short_circuits_while_open(self):
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        for _ in range(10):
+            with self.assertRaises(CircuitOpenError):
+                self.api.get('https://c.com/programs')
+        self.assertEqual(self.calls, 5)
+
+    def test_one_probe_per_interval(self):
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        self.clock[0] += 60
+        for _ in range(3):
+            with self.assertRaises(CircuitOpenError):
+                self.api.get('https://c.com/programs')
+        self.assertEqual(self.calls, 6)
+
+    def test_closes_after_successful_probe(self):
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        self.clock[0] += 60
+        self.status, self.text = 200, '{"ok": 1}'
+        self.assertEqual(self.api.get('https://c.com/programs'), {'ok': 1})
+        self.assertFalse(self.api.breakers['c.com'].is_open)
+        self.assertEqual(self.api.get('https://c.com/programs'), {'ok': 1})
+
+    def test_non_json_not_found_counts_as_failure(self):
+        self.status, self.text = 404, '<html>'
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        self.assertEqual(self.calls, 5)
+        self.assertTrue(self.api.breakers['c.com'].is_open)
+
+    def test_json_not_found_is_returned(self):
+        self.status, self.text = 404, '{"status": 404}'
+        self.assertEqual(self.api.get('https://c.com/programs'), {'status': 404})
+        self.assertEqual(self.api.breakers['c.com'].failures, 0)
+
+    def test_exhausted_retries_open_circuit(self):
+        breaker = self.api._breaker('https://c.com')
+        breaker.failure_threshold = 10
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        self.assertEqual(self.calls, 5)
+        self.assertTrue(breaker.is_open)
+
+    def test_save_results_skipped_when_degraded(self):
+        with self.assertRaises(CircuitOpenError):
+            self.api.get('https://c.com/programs')
+        with tempfile.TemporaryDirectory() as directory:
+            public_programs = PublicPrograms(api=self.api)
+            public_programs.results_directory = directory
+            public_programs.save_results('c.json')
+            self.assertFalse(os.path.exists(os.path.join(directory, 'c.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()